@@ -7,21 +7,30 @@ Run on the machine where VRChat is running.
 Requires: pip install python-osc flask flask-httpauth flask-limiter python-dotenv pydantic flask-cors
 """
 
-from flask import Flask, request, jsonify, send_file
+from flask import Flask, request, jsonify
+from flask.json.provider import JSONProvider
 from flask_httpauth import HTTPTokenAuth
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 from flask_cors import CORS
 from pythonosc import udp_client
-from pydantic import BaseModel, ValidationError, Field, validator
+from pydantic import BaseModel, ValidationError, Field, field_validator, model_validator
 from dotenv import load_dotenv
 import time
 import io
+import hashlib
+import re
+import struct
 import subprocess
 import webbrowser
 import os
 import platform
 import logging
+import threading
+import queue
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from functools import wraps
 
 # Load environment variables
@@ -33,6 +42,8 @@ if not API_KEY:
     raise ValueError("❌ API_KEY must be set in environment variables (.env file)")
 
 DEBUG = os.getenv('DEBUG', 'false').lower() == 'true'
+BRIDGE_THREADS = int(os.getenv('BRIDGE_THREADS', 8))
+MEDIA_WORKERS = int(os.getenv('MEDIA_WORKERS', 2))
 FLASK_ENV = os.getenv('FLASK_ENV', 'production')
 
 # Setup logging
@@ -43,37 +54,73 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 audit_logger = logging.getLogger('audit')
 
+# Try to import fast JSON library (falls back to Flask's stdlib json)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Try to import screenshot library
 try:
-    from PIL import ImageGrab
+    from PIL import Image, ImageGrab
     SCREENSHOT_AVAILABLE = True
 except ImportError:
     SCREENSHOT_AVAILABLE = False
     print("⚠️  PIL not installed - screenshot disabled. Run: pip install Pillow")
 
+# Try to import fast screen capture library (falls back to PIL ImageGrab)
+try:
+    import mss
+    MSS_AVAILABLE = True
+except ImportError:
+    MSS_AVAILABLE = False
+
+# Try to import SIMD JPEG encoder (falls back to PIL's encoder)
+try:
+    import numpy as np
+    from turbojpeg import TurboJPEG, TJPF_BGRA, TJPF_RGB, TJSAMP_420
+    _tj = TurboJPEG()
+    TURBOJPEG_AVAILABLE = True
+except (ImportError, OSError, RuntimeError):
+    TURBOJPEG_AVAILABLE = False
+
 # Try to import audio recording library
 try:
     import sounddevice as sd
     import numpy as np
-    try:
-        from scipy.io.wavfile import write as write_wav
-    except ImportError:
-        # Fallback: use wave module
-        import wave
-        def write_wav(filename, rate, data):
-            with wave.open(filename, 'wb') as wf:
-                wf.setnchannels(1)
-                wf.setsampwidth(2)  # 16-bit
-                wf.setframerate(rate)
-                wf.writeframes(data.tobytes())
     AUDIO_AVAILABLE = True
 except ImportError:
     AUDIO_AVAILABLE = False
-    print("⚠️  Audio libs not installed - voice disabled. Run: pip install sounddevice numpy scipy")
+    print("⚠️  Audio libs not installed - voice disabled. Run: pip install sounddevice numpy")
+
+# Try to import JIT compiler for the PCM conversion (falls back to numpy)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 # Initialize Flask app
 app = Flask(__name__)
 
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson (request parsing and jsonify)"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # jsonify() lands here: keep orjson's bytes instead of a str round trip
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj), mimetype='application/json')
+
+if ORJSON_AVAILABLE:
+    app.json = OrjsonProvider(app)
+
 # CORS configuration (restrict in production)
 CORS(app, resources={
     r"/*": {
@@ -90,6 +137,21 @@ auth = HTTPTokenAuth(scheme='Bearer')
 def verify_token(token):
     return token == API_KEY
 
+def with_json(f):
+    """Parse the JSON body once and pass it as `data` (empty dict if there is no body)"""
+    @wraps(f)
+    def wrapper(*args, **kwargs):
+        if not request.get_data():
+            data = {}
+        else:
+            # A body that isn't a JSON object must not silently fall back to defaults
+            data = request.get_json(force=True, silent=True)
+            if not isinstance(data, dict):
+                logger.warning(f"Invalid JSON body for {request.path}")
+                return jsonify({"error": "Invalid request", "details": "Body must be a JSON object"}), 400
+        return f(data, *args, **kwargs)
+    return wrapper
+
 # Rate Limiting
 limiter = Limiter(
     app=app,
@@ -98,7 +160,11 @@ limiter = Limiter(
         f"{os.getenv('RATE_LIMIT_PER_MINUTE', 60)} per minute",
         f"{os.getenv('RATE_LIMIT_PER_HOUR', 1000)} per hour"
     ],
-    storage_uri="memory://"
+    # memory:// is per process; use a shared backend (e.g. redis://) when
+    # running several worker processes so limits aren't multiplied
+    storage_uri=os.getenv('RATE_LIMIT_STORAGE', 'memory://'),
+    # moving-window has no double burst at window boundaries
+    strategy=os.getenv('RATE_LIMIT_STRATEGY', 'moving-window')
 )
 
 # Pydantic validation schemas
@@ -117,36 +183,399 @@ class AvatarParameterRequest(BaseModel):
     name: str = Field(..., min_length=1, max_length=100, pattern=r'^[a-zA-Z0-9_]+$')
     value: float = Field(..., ge=-1.0, le=1.0)
 
+# Whitelist of allowed OSC addresses for /raw
+ALLOWED_OSC_PREFIXES = ('/chatbox/', '/input/', '/avatar/parameters/')
+
 class RawOSCRequest(BaseModel):
     address: str = Field(..., min_length=1, max_length=200)
-    args: list = Field(default_factory=list, max_items=10)
+    args: list = Field(default_factory=list, max_length=10)
 
-    @validator('address')
+    @field_validator('address')
+    @classmethod
     def validate_address(cls, v):
-        # Whitelist of allowed OSC addresses
-        allowed_prefixes = [
-            '/chatbox/',
-            '/input/',
-            '/avatar/parameters/'
-        ]
-        if not any(v.startswith(prefix) for prefix in allowed_prefixes):
+        if not v.startswith(ALLOWED_OSC_PREFIXES):
             raise ValueError(f'OSC address {v} not allowed')
         return v
 
+# vrchat:// URL handler, picked once for this platform
+_open_url = os.startfile if platform.system() == 'Windows' else webbrowser.open
+
+# World ID embedded in a vrchat.com web URL
+_WRLD_RE = re.compile(r'wrld_[A-Za-z0-9_-]+')
+
 class LaunchWorldRequest(BaseModel):
     url: str = Field(default='', max_length=500)
     world_id: str = Field(default='', pattern=r'^(wrld_[a-f0-9-]+)?$')
 
-    @validator('world_id', 'url')
-    def validate_not_empty(cls, v, values, field):
-        if field.name == 'url' and not v and not values.get('world_id'):
+    @model_validator(mode='after')
+    def validate_not_empty(self):
+        if not self.url and not self.world_id:
             raise ValueError('Either url or world_id must be provided')
-        return v
+        return self
+
+# mss handles are not thread-safe, keep one per worker thread
+_mss_local = threading.local()
+
+def _get_mss():
+    """Return this thread's mss handle, creating it on first use"""
+    sct = getattr(_mss_local, 'sct', None)
+    if sct is None:
+        sct = _mss_local.sct = mss.mss()
+    return sct
+
+def _grab_monitor(monitor):
+    """Grab a monitor with mss: 0 is all monitors combined, 1 the primary"""
+    sct = _get_mss()
+    if not 0 <= monitor < len(sct.monitors):
+        raise IndexError(f"Monitor {monitor} not available ({len(sct.monitors) - 1} connected)")
+    return sct.grab(sct.monitors[monitor])
+
+def _grab_screen(monitor=1):
+    """Capture a monitor as a PIL image"""
+    if MSS_AVAILABLE:
+        shot = _grab_monitor(monitor)
+        # Decode the BGRA buffer in place rather than building shot.rgb first
+        return Image.frombuffer('RGB', shot.size, shot.raw, 'raw', 'BGRX', 0, 1)
+    if monitor not in (0, 1):
+        raise IndexError(f"Monitor {monitor} not available (selecting other monitors needs mss)")
+    return ImageGrab.grab(all_screens=monitor == 0)
+
+def _frame_etag(frame, quality, scale, monitor):
+    """ETag from every pixel of the captured frame plus the output settings.
+
+    Hashing the whole frame (~9 ms at 1080p) is still well under a JPEG
+    encode, and unlike a thumbnail it can't miss a small change.
+    """
+    pixels = frame.tobytes() if isinstance(frame, Image.Image) else memoryview(frame)
+    digest = hashlib.blake2b(pixels, digest_size=16)
+    digest.update(f"{quality}:{scale}:{monitor}".encode())
+    return digest.hexdigest()
+
+def _capture_jpeg(quality, scale, monitor=1, if_none_match=None):
+    """Capture a monitor and return (etag, JPEG bytes).
+
+    The JPEG is None when the frame's ETag is in ``if_none_match``: the
+    screen hasn't visibly changed, so the encode is skipped.
+    """
+    if MSS_AVAILABLE and TURBOJPEG_AVAILABLE and scale >= 1.0:
+        # Work on the raw BGRA frame directly, no PIL image in between
+        shot = _grab_monitor(monitor)
+        frame = np.frombuffer(shot.raw, dtype=np.uint8).reshape(shot.height, shot.width, 4)
+        etag = _frame_etag(frame, quality, scale, monitor)
+        if if_none_match and if_none_match.contains_weak(etag):
+            return etag, None
+        return etag, _tj.encode(frame, quality=quality, pixel_format=TJPF_BGRA, jpeg_subsample=TJSAMP_420)
+
+    img = _grab_screen(monitor)
+    # Fingerprint the full-resolution capture, before downscaling can blur changes away
+    etag = _frame_etag(img, quality, scale, monitor)
+    if if_none_match and if_none_match.contains_weak(etag):
+        return etag, None
+    if scale < 1.0:
+        img = img.resize((int(img.width * scale), int(img.height * scale)), Image.BILINEAR)
+
+    if TURBOJPEG_AVAILABLE:
+        if img.mode != 'RGB':
+            img = img.convert('RGB')
+        return etag, _tj.encode(np.asarray(img), quality=quality, pixel_format=TJPF_RGB, jpeg_subsample=TJSAMP_420)
+
+    # 4:2:0 chroma subsampling, baseline
+    img_bytes = io.BytesIO()
+    img.save(img_bytes, format='JPEG', quality=quality, subsampling=2)
+    return etag, img_bytes.getvalue()
+
+# Audio capture: one always-running callback stream per (device, sample rate)
+# feeding a ring buffer, so recordings never open, start or stop PortAudio
+MAX_RECORD_SECONDS = 30
+AUDIO_POOL_SIZE = 4
+AUDIO_STALL_SECONDS = 2  # grace period before a silent device is an error
+_audio_streams = {}
+_audio_lock = threading.Lock()
+
+class _AudioRing:
+    """Mono float32 input continuously written into a circular buffer"""
+
+    def __init__(self, device, sample_rate):
+        # Twice the longest recording, so a reader copying its window is
+        # never overtaken by the callback
+        self.data = np.zeros(2 * MAX_RECORD_SECONDS * sample_rate, dtype='float32')
+        self.written = 0  # total frames captured since the stream started
+        self.cond = threading.Condition()
+        self.stream = sd.InputStream(samplerate=sample_rate, channels=1, dtype='float32',
+                                     device=device, callback=self._on_audio)
+        self.stream.start()
+
+    def _on_audio(self, indata, frames, time_info, status):
+        size = len(self.data)
+        start = self.written % size
+        split = min(frames, size - start)
+        self.data[start:start + split] = indata[:split, 0]
+        self.data[:frames - split] = indata[split:, 0]
+        with self.cond:
+            self.written += frames
+            self.cond.notify_all()
+
+    def record(self, out, timeout):
+        """Fill out with the next len(out) frames captured from now on"""
+        with self.cond:
+            start = self.written
+            end = start + len(out)
+            if not self.cond.wait_for(lambda: self.written >= end, timeout):
+                raise RuntimeError("Audio input stalled")
+        size = len(self.data)
+        first = start % size
+        split = min(len(out), size - first)
+        out[:split] = self.data[first:first + split]
+        out[split:] = self.data[:len(out) - split]
+
+def _get_audio_ring(device, sample_rate):
+    with _audio_lock:
+        key = (device, sample_rate)
+        ring = _audio_streams.get(key)
+        # Reopen if the device went away and PortAudio stopped the stream
+        if ring is None or not ring.stream.active:
+            if ring is not None:
+                ring.stream.close()
+            ring = _audio_streams[key] = _AudioRing(device, sample_rate)
+        return ring
+
+# Recycled 30 s float32 recording buffers, per sample rate
+_audio_pools = defaultdict(lambda: queue.LifoQueue(maxsize=AUDIO_POOL_SIZE))
+
+def _acquire_buffer(sample_rate):
+    try:
+        return _audio_pools[sample_rate].get_nowait()
+    except queue.Empty:
+        return np.empty(MAX_RECORD_SECONDS * sample_rate, dtype='float32')
+
+def _release_buffer(sample_rate, buffer):
+    try:
+        _audio_pools[sample_rate].put_nowait(buffer)
+    except queue.Full:
+        pass
+
+@contextmanager
+def _recording(duration, sample_rate, device=None):
+    """Record mono float32 audio into a pooled buffer and yield it.
+
+    The yielded array is only valid inside the ``with`` block; the buffer
+    goes back to the pool afterwards.
+    """
+    frames = min(max(int(duration * sample_rate), 0), MAX_RECORD_SECONDS * sample_rate)
+    buffer = _acquire_buffer(sample_rate)
+    try:
+        out = buffer[:frames]
+        _get_audio_ring(device, sample_rate).record(out, frames / sample_rate + AUDIO_STALL_SECONDS)
+        yield out
+    finally:
+        _release_buffer(sample_rate, buffer)
+
+if NUMBA_AVAILABLE:
+    @njit(fastmath=True, cache=True)
+    def _f32_to_i16(src, dst):
+        """Scale, clip and cast in a single pass"""
+        for i in range(src.shape[0]):
+            v = src[i] * 32767.0
+            if v > 32767.0:
+                v = 32767.0
+            elif v < -32768.0:
+                v = -32768.0
+            dst[i] = np.int16(v)
+
+def _to_int16(samples):
+    """Convert float32 samples in [-1, 1] to mono int16 PCM"""
+    src = samples.reshape(-1)
+    if NUMBA_AVAILABLE:
+        out = np.empty(src.shape[0], dtype=np.int16)
+        _f32_to_i16(src, out)
+        return out
+    return np.clip(src * 32767.0, -32768, 32767).astype(np.int16)
+
+WAV_CHUNK_BYTES = 64 * 1024
+
+def _wav_header(rate, size):
+    """44-byte RIFF header for mono 16-bit PCM with a data chunk of size bytes"""
+    return (b'RIFF' + struct.pack('<I', 36 + size) + b'WAVE'
+            + b'fmt ' + struct.pack('<IHHIIHH', 16, 1, 1, rate, rate * 2, 2, 16)
+            + b'data' + struct.pack('<I', size))
+
+def _wav_chunks(rate, pcm):
+    """Yield a WAV file for int16 PCM: the header, then the samples in 64 KB slices"""
+    yield _wav_header(rate, pcm.nbytes)
+    data = memoryview(pcm).cast('B')
+    for offset in range(0, len(data), WAV_CHUNK_BYTES):
+        yield bytes(data[offset:offset + WAV_CHUNK_BYTES])
+
+# Screen capture, encoding, PCM conversion and inference run on a small
+# dedicated pool: request threads stay free for light endpoints and heavy
+# work is bounded. Recordings wait for audio on the request thread and only
+# hand the CPU work to the pool, so idle waiting never occupies a worker.
+# Threads rather than processes: libjpeg-turbo, PIL, PortAudio and CTranslate2
+# release the GIL, and frames/models would be expensive to ship to a process.
+_MEDIA_POOL = ThreadPoolExecutor(max_workers=MEDIA_WORKERS, thread_name_prefix='media')
+
+def _record_pcm(duration, sample_rate):
+    """Record from the default input and return it as int16 PCM"""
+    logger.info(f"Recording {duration}s of audio...")
+    # Record audio from default input (microphone or loopback)
+    with _recording(duration, sample_rate) as recording:
+        logger.info("Recording complete!")
+        # Fresh array: the pooled float buffer is recycled once the block exits
+        return _MEDIA_POOL.submit(_to_int16, recording).result()
+
+def _transcribe_audio(audio):
+    """Run Whisper on mono float32 audio and return (text, language)"""
+    model = _get_whisper()
+    logger.info("Transcribing with Whisper...")
+    # Auto-detect language (don't force French)
+    segments, info = model.transcribe(audio, beam_size=WHISPER_BEAM_SIZE)
+    text = "".join(segment.text for segment in segments).strip()
+    return text, info.language
+
+def _to_whisper_audio(recording):
+    """Flatten a float32 recording into the mono [-1, 1] array Whisper accepts"""
+    return recording.reshape(-1)
+
+def _record_transcript(duration, sample_rate, device=None):
+    """Record from an input device and return (text, language)"""
+    logger.info(f"Recording {duration}s of audio...")
+    with _recording(duration, sample_rate, device) as recording:
+        logger.info("Recording complete!")
+        # Feed the samples straight to Whisper (no WAV round-trip)
+        return _MEDIA_POOL.submit(_transcribe_audio, _to_whisper_audio(recording)).result()
+
 
 # VRChat OSC settings (localhost because VRChat only listens locally)
 VRC_IP = os.getenv('VRC_IP', '127.0.0.1')
 VRC_PORT = int(os.getenv('VRC_PORT', 9000))
-osc = udp_client.SimpleUDPClient(VRC_IP, VRC_PORT)
+
+class ConnectedUDPClient(udp_client.SimpleUDPClient):
+    """SimpleUDPClient whose socket is connect()-ed to VRChat once.
+
+    The kernel resolves the route a single time and every datagram goes out
+    with a plain send() instead of sendto() with an address.
+    """
+
+    def __init__(self, address, port):
+        super().__init__(address, port)
+        self._sock.connect((address, port))
+
+    def send(self, content):
+        self.send_raw(content.dgram)
+
+    def send_raw(self, dgram):
+        try:
+            self._sock.send(dgram)
+        except ConnectionError:
+            # ICMP "port unreachable" from an earlier datagram (VRChat not
+            # listening yet) surfaces as ECONNREFUSED on Linux and
+            # WSAECONNRESET on Windows; drop it like an unconnected socket would
+            pass
+
+osc = ConnectedUDPClient(VRC_IP, VRC_PORT)
+
+# Fixed-shape OSC messages: the padded address and type tag are encoded once,
+# only the argument is packed per send. Variable endpoints (/raw, /chatbox,
+# /avatar/parameter) keep using osc.send_message.
+def _osc_prefix(address, typetags):
+    """Encode the address and type tag strings of an OSC message"""
+    def pad(b):
+        return b + b'\0' * (4 - len(b) % 4)
+    return pad(address.encode('ascii')) + pad((',' + typetags).encode('ascii'))
+
+_OSC_VERTICAL = _osc_prefix('/input/Vertical', 'f')
+_OSC_HORIZONTAL = _osc_prefix('/input/Horizontal', 'f')
+_OSC_LOOK_HORIZONTAL = _osc_prefix('/input/LookHorizontal', 'f')
+
+# Toggle endpoints only ever send one of two packets, so build them whole
+_JUMP_ON = _osc_prefix('/input/Jump', 'i') + struct.pack('>i', 1)
+_JUMP_OFF = _osc_prefix('/input/Jump', 'i') + struct.pack('>i', 0)
+_RUN_ON = _osc_prefix('/input/Run', 'i') + struct.pack('>i', 1)
+_RUN_OFF = _osc_prefix('/input/Run', 'i') + struct.pack('>i', 0)
+_VOICE_ON = _osc_prefix('/input/Voice', 'i') + struct.pack('>i', 1)
+_VOICE_OFF = _osc_prefix('/input/Voice', 'i') + struct.pack('>i', 0)
+_TYPING_ON = _osc_prefix('/chatbox/typing', 'T')
+_TYPING_OFF = _osc_prefix('/chatbox/typing', 'F')
+
+# "#bundle" + timetag 1 (immediately)
+_OSC_BUNDLE_HEADER = b'#bundle\0' + struct.pack('>Q', 1)
+
+def _float_bundle(*prefixes):
+    """Prebuild an OSC bundle of float messages, returns (packet, argument offsets)"""
+    packet = bytearray(_OSC_BUNDLE_HEADER)
+    offsets = []
+    for prefix in prefixes:
+        packet += struct.pack('>i', len(prefix) + 4) + prefix
+        offsets.append(len(packet))
+        packet += bytes(4)
+    return packet, offsets
+
+# /move bundles, the floats are patched in place before each send
+_MOVE_BUNDLE = _float_bundle(_OSC_VERTICAL, _OSC_HORIZONTAL)
+_MOVE_LOOK_BUNDLE = _float_bundle(_OSC_VERTICAL, _OSC_HORIZONTAL, _OSC_LOOK_HORIZONTAL)
+# The reset never changes: all three axes back to 0.0 (the zeroed template)
+_MOVE_RESET = bytes(_MOVE_LOOK_BUNDLE[0])
+
+def _send_float_bundle(bundle, *values):
+    """Write the values into a prebuilt bundle and send it (caller holds _move_lock)"""
+    packet, offsets = bundle
+    for offset, value in zip(offsets, values):
+        struct.pack_into('>f', packet, offset, value)
+    osc.send_raw(packet)
+
+# How long /jump holds the button down
+JUMP_HOLD_SECONDS = 0.1
+
+# Pending /move reset (a newer /move supersedes the previous one)
+_move_lock = threading.Lock()
+_move_timer = None
+_move_id = 0
+
+def _reset_move(move_id):
+    """Stop moving, unless a newer /move has taken over since"""
+    with _move_lock:
+        if move_id != _move_id:
+            return
+        osc.send_raw(_MOVE_RESET)
+
+# Whisper model (loaded once, shared by all /transcribe calls)
+WHISPER_MODEL = os.getenv('WHISPER_MODEL', 'base')
+WHISPER_DEVICE = os.getenv('WHISPER_DEVICE', 'auto')
+WHISPER_BEAM_SIZE = int(os.getenv('WHISPER_BEAM_SIZE', 1))  # 1 = greedy decoding
+_whisper_model = None
+_whisper_lock = threading.Lock()
+
+def _get_whisper():
+    """Load the faster-whisper model on first use and return the cached instance"""
+    global _whisper_model
+    if _whisper_model is not None:
+        # Fast path: no lock once the model is loaded
+        return _whisper_model
+    with _whisper_lock:
+        if _whisper_model is None:
+            from faster_whisper import WhisperModel
+            device = WHISPER_DEVICE
+            if device == 'auto':
+                import ctranslate2
+                device = 'cuda' if ctranslate2.get_cuda_device_count() > 0 else 'cpu'
+            # int8 weights everywhere, fp16 activations on GPU
+            compute_type = 'int8_float16' if device == 'cuda' else 'int8'
+            logger.info(f"Loading Whisper model '{WHISPER_MODEL}' on {device} ({compute_type})...")
+            _whisper_model = WhisperModel(WHISPER_MODEL, device=device, compute_type=compute_type)
+        return _whisper_model
+
+def _warm_up():
+    """Pay one-off load costs in the background so first requests don't"""
+    if NUMBA_AVAILABLE:
+        # Compiles (or loads from the on-disk cache) the PCM kernel
+        _to_int16(np.zeros(1, dtype='float32'))
+    if AUDIO_AVAILABLE:
+        try:
+            _get_whisper()
+        except ImportError:
+            logger.info("Whisper not installed - /transcribe disabled")
+        except Exception:
+            logger.error("Whisper warm-up failed", exc_info=True)
 
 @app.route('/health', methods=['GET'])
 @auth.login_required
@@ -161,7 +590,7 @@ def chatbox():
     """Send a message to VRChat chatbox - AUTHENTICATED & RATE LIMITED"""
     try:
         # Validate request
-        data = ChatboxRequest(**request.json)
+        data = ChatboxRequest.model_validate_json(request.get_data(cache=False))
 
         # Audit log
         audit_logger.info(f"Chatbox message sent: {data.message[:50]}...")
@@ -181,12 +610,12 @@ def chatbox():
 @app.route('/chatbox/typing', methods=['POST'])
 @auth.login_required
 @limiter.limit("60 per minute")
-def chatbox_typing():
+@with_json
+def chatbox_typing(data):
     """Toggle typing indicator - AUTHENTICATED & RATE LIMITED"""
     try:
-        data = request.json or {}
         typing = data.get('typing', True)
-        osc.send_message("/chatbox/typing", typing)
+        osc.send_raw(_TYPING_ON if typing else _TYPING_OFF)
         return jsonify({"status": "ok", "typing": typing})
     except Exception as e:
         logger.error("Error in chatbox_typing", exc_info=True)
@@ -197,23 +626,29 @@ def chatbox_typing():
 @limiter.limit("60 per minute")
 def move():
     """Move the avatar - AUTHENTICATED & RATE LIMITED"""
+    global _move_timer, _move_id
     try:
         # Validate request
-        data = MoveRequest(**request.json)
-
-        # Send movement
-        osc.send_message("/input/Vertical", float(data.vertical))
-        osc.send_message("/input/Horizontal", float(data.horizontal))
-        if data.look != 0:
-            osc.send_message("/input/LookHorizontal", float(data.look))
-
-        # Hold for duration
-        if data.duration > 0:
-            time.sleep(data.duration)
-            # Reset to stop moving
-            osc.send_message("/input/Vertical", 0.0)
-            osc.send_message("/input/Horizontal", 0.0)
-            osc.send_message("/input/LookHorizontal", 0.0)
+        data = MoveRequest.model_validate_json(request.get_data(cache=False))
+
+        with _move_lock:
+            # Cancel the reset still pending from a previous /move
+            _move_id += 1
+            if _move_timer is not None:
+                _move_timer.cancel()
+                _move_timer = None
+
+            # Send movement (all axes in a single bundle)
+            if data.look != 0:
+                _send_float_bundle(_MOVE_LOOK_BUNDLE, data.vertical, data.horizontal, data.look)
+            else:
+                _send_float_bundle(_MOVE_BUNDLE, data.vertical, data.horizontal)
+
+            # Hold for duration, then reset in the background
+            if data.duration > 0:
+                _move_timer = threading.Timer(data.duration, _reset_move, args=(_move_id,))
+                _move_timer.daemon = True
+                _move_timer.start()
 
         return jsonify({"status": "moved", "vertical": data.vertical, "horizontal": data.horizontal})
 
@@ -231,9 +666,11 @@ def move():
 def jump():
     """Make the avatar jump - AUTHENTICATED & RATE LIMITED"""
     try:
-        osc.send_message("/input/Jump", 1)
-        time.sleep(0.1)
-        osc.send_message("/input/Jump", 0)
+        osc.send_raw(_JUMP_ON)
+        # Release the button in the background instead of sleeping on the request thread
+        release = threading.Timer(JUMP_HOLD_SECONDS, osc.send_raw, args=(_JUMP_OFF,))
+        release.daemon = True
+        release.start()
         return jsonify({"status": "jumped"})
     except Exception as e:
         logger.error("Error in jump endpoint", exc_info=True)
@@ -242,12 +679,12 @@ def jump():
 @app.route('/run', methods=['POST'])
 @auth.login_required
 @limiter.limit("60 per minute")
-def run():
+@with_json
+def run(data):
     """Toggle running - AUTHENTICATED & RATE LIMITED"""
     try:
-        data = request.json or {}
         running = data.get('running', True)
-        osc.send_message("/input/Run", 1 if running else 0)
+        osc.send_raw(_RUN_ON if running else _RUN_OFF)
         return jsonify({"status": "ok", "running": running})
     except Exception as e:
         logger.error("Error in run endpoint", exc_info=True)
@@ -260,7 +697,7 @@ def avatar_parameter():
     """Set an avatar parameter - AUTHENTICATED & RATE LIMITED"""
     try:
         # Validate request
-        data = AvatarParameterRequest(**request.json)
+        data = AvatarParameterRequest.model_validate_json(request.get_data(cache=False))
 
         # Send to VRChat
         osc.send_message(f"/avatar/parameters/{data.name}", data.value)
@@ -277,12 +714,12 @@ def avatar_parameter():
 @app.route('/voice', methods=['POST'])
 @auth.login_required
 @limiter.limit("60 per minute")
-def voice():
+@with_json
+def voice(data):
     """Toggle voice/mute - AUTHENTICATED & RATE LIMITED"""
     try:
-        data = request.json or {}
         unmute = data.get('unmute', True)
-        osc.send_message("/input/Voice", 1 if unmute else 0)
+        osc.send_raw(_VOICE_ON if unmute else _VOICE_OFF)
         return jsonify({"status": "ok", "unmute": unmute})
     except Exception as e:
         logger.error("Error in voice endpoint", exc_info=True)
@@ -295,7 +732,7 @@ def raw_osc():
     """Send a raw OSC message - AUTHENTICATED & HEAVILY RATE LIMITED"""
     try:
         # Validate request with strict whitelist
-        data = RawOSCRequest(**request.json)
+        data = RawOSCRequest.model_validate_json(request.get_data(cache=False))
 
         # Audit log critical action
         audit_logger.warning(f"Raw OSC message sent: {data.address} with args {data.args}")
@@ -319,7 +756,7 @@ def launch_world():
     """Launch a VRChat world - AUTHENTICATED & HEAVILY RATE LIMITED"""
     try:
         # Validate request
-        data = LaunchWorldRequest(**request.json)
+        data = LaunchWorldRequest.model_validate_json(request.get_data(cache=False))
 
         url = data.url
         world_id = data.world_id
@@ -329,25 +766,18 @@ def launch_world():
             launch_url = url
             if url.startswith('https://vrchat.com/home/world/'):
                 # Convert web URL to launch URL
-                parts = url.split('/')
-                for part in parts:
-                    if part.startswith('wrld_'):
-                        world_id = part
-                        break
-
-        if world_id and not url:
+                match = _WRLD_RE.search(url)
+                if match:
+                    launch_url = f"vrchat://launch?ref=vrchat.com&id={match.group(0)}"
+        else:
+            # Schema guarantees world_id when url is empty
             launch_url = f"vrchat://launch?ref=vrchat.com&id={world_id}"
-        elif not url:
-            return jsonify({"error": "Provide 'url' or 'world_id'"}), 400
 
         # Audit log
         audit_logger.warning(f"World launch requested: {launch_url}")
 
         # Open the VRChat URL
-        if platform.system() == 'Windows':
-            os.startfile(launch_url)
-        else:
-            webbrowser.open(launch_url)
+        _open_url(launch_url)
 
         return jsonify({"status": "launched", "url": launch_url})
 
@@ -361,25 +791,43 @@ def launch_world():
 
 @app.route('/screenshot', methods=['GET'])
 @auth.login_required
-@limiter.limit("5 per hour")
+# New frames count against the hourly budget; a 304 still grabs and hashes the
+# screen but skips the encode and the body, so it only counts against the
+# per-minute cap that bounds polling
+@limiter.limit("5 per hour", deduct_when=lambda response: response.status_code != 304)
+@limiter.limit("60 per minute")
 def screenshot():
     """Capture and return a screenshot - AUTHENTICATED & HEAVILY RATE LIMITED"""
     if not SCREENSHOT_AVAILABLE:
         return jsonify({"error": "PIL not installed. Run: pip install Pillow"}), 500
 
     try:
+        # Optional output tuning: JPEG quality (10-95) and downscale factor (0.1-1.0)
+        quality = min(max(request.args.get('quality', 55, type=int), 10), 95)
+        scale = min(max(request.args.get('scale', 1.0, type=float), 0.1), 1.0)
+        # mss monitor index: 0 = all monitors, 1 = primary (default)
+        monitor = request.args.get('monitor', 1, type=int)
+
         # Audit log
         audit_logger.warning("Screenshot requested")
 
-        # Capture the screen
-        img = ImageGrab.grab()
+        # Capture and encode the screen (skipped if the client's copy is current)
+        etag, jpeg = _MEDIA_POOL.submit(
+            _capture_jpeg, quality, scale, monitor, request.if_none_match).result()
 
-        # Convert to bytes
-        img_bytes = io.BytesIO()
-        img.save(img_bytes, format='JPEG', quality=70)
-        img_bytes.seek(0)
-
-        return send_file(img_bytes, mimetype='image/jpeg')
+        if jpeg is None:
+            response = app.response_class(status=304)
+        else:
+            # Already in memory: hand the bytes to the server in one write
+            response = app.response_class(jpeg, mimetype='image/jpeg')
+        # Weak: the tag fingerprints the pixels, not the JPEG bytes
+        response.set_etag(etag, weak=True)
+        return response
+
+    except IndexError as e:
+        # Monitor index that this machine (or the capture backend) can't provide
+        logger.warning(f"Invalid monitor in screenshot: {e}")
+        return jsonify({"error": "Invalid request", "details": str(e)}), 400
 
     except Exception as e:
         logger.error("Error in screenshot endpoint", exc_info=True)
@@ -388,36 +836,35 @@ def screenshot():
 @app.route('/listen', methods=['POST'])
 @auth.login_required
 @limiter.limit("10 per hour")
-def listen():
+@with_json
+def listen(data):
     """Record audio for a few seconds - AUTHENTICATED & HEAVILY RATE LIMITED"""
     if not AUDIO_AVAILABLE:
-        return jsonify({"error": "Audio libs not installed. Run: pip install sounddevice numpy scipy"}), 500
+        return jsonify({"error": "Audio libs not installed. Run: pip install sounddevice numpy"}), 500
 
     try:
-        data = request.json or {}
         duration = min(data.get('duration', 5), 30)  # Cap at 30 seconds
         sample_rate = 44100
 
         # Audit log
         audit_logger.warning(f"Audio recording requested: {duration}s")
 
-        logger.info(f"Recording {duration}s of audio...")
-        # Record audio from default input (microphone or loopback)
-        recording = sd.rec(int(duration * sample_rate), samplerate=sample_rate, channels=1, dtype='int16')
-        sd.wait()  # Wait for recording to finish
-        logger.info("Recording complete!")
-
-        # Convert to WAV bytes
-        wav_bytes = io.BytesIO()
-        write_wav(wav_bytes, sample_rate, recording)
-        wav_bytes.seek(0)
+        pcm = _record_pcm(duration, sample_rate)
 
-        return send_file(wav_bytes, mimetype='audio/wav')
+        # Stream the file out instead of assembling a second copy as bytes
+        response = app.response_class(_wav_chunks(sample_rate, pcm), mimetype='audio/wav')
+        response.content_length = 44 + pcm.nbytes
+        return response
 
     except Exception as e:
         logger.error("Error in listen endpoint", exc_info=True)
         return jsonify({"error": "Internal server error"}), 500
 
+# PortAudio device enumeration is slow and rarely changes
+DEVICES_CACHE_TTL = 10  # seconds
+_devices_cache = {'time': float('-inf'), 'devices': None}
+_devices_lock = threading.Lock()
+
 @app.route('/listen/devices', methods=['GET'])
 @auth.login_required
 @limiter.limit("20 per minute")
@@ -427,17 +874,23 @@ def list_audio_devices():
         return jsonify({"error": "Audio libs not installed"}), 500
 
     try:
-        devices = sd.query_devices()
-        device_list = []
-        for i, d in enumerate(devices):
-            device_list.append({
-                "id": i,
-                "name": d['name'],
-                "inputs": d['max_input_channels'],
-                "outputs": d['max_output_channels'],
-                "default_input": i == sd.default.device[0],
-                "default_output": i == sd.default.device[1]
-            })
+        refresh = request.args.get('refresh', '').lower() in ('1', 'true')
+        with _devices_lock:
+            if refresh or time.monotonic() - _devices_cache['time'] > DEVICES_CACHE_TTL:
+                devices = sd.query_devices()
+                device_list = []
+                for i, d in enumerate(devices):
+                    device_list.append({
+                        "id": i,
+                        "name": d['name'],
+                        "inputs": d['max_input_channels'],
+                        "outputs": d['max_output_channels'],
+                        "default_input": i == sd.default.device[0],
+                        "default_output": i == sd.default.device[1]
+                    })
+                _devices_cache['devices'] = device_list
+                _devices_cache['time'] = time.monotonic()
+            device_list = _devices_cache['devices']
         return jsonify({"devices": device_list})
 
     except Exception as e:
@@ -447,78 +900,42 @@ def list_audio_devices():
 @app.route('/transcribe', methods=['POST'])
 @auth.login_required
 @limiter.limit("10 per hour")
-def transcribe():
+@with_json
+def transcribe(data):
     """Record audio and transcribe with Whisper - AUTHENTICATED & HEAVILY RATE LIMITED"""
     if not AUDIO_AVAILABLE:
         return jsonify({"error": "Audio libs not installed"}), 500
 
-    temp_path = None
     try:
-        import whisper
-        import tempfile
-
-        data = request.json or {}
         duration = min(data.get('duration', 5), 30)  # Cap at 30 seconds
         device_id = data.get('device_id', None)  # Optional: specify input device
-        sample_rate = 16000  # Whisper prefers 16kHz
+        sample_rate = 16000  # Whisper expects 16kHz
 
         # Audit log
         audit_logger.warning(f"Transcription requested: {duration}s")
 
-        # Create secure temporary file
-        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp:
-            temp_path = tmp.name
-
-        # Set restrictive permissions (owner read/write only)
-        os.chmod(temp_path, 0o600)
-
-        logger.info(f"Recording {duration}s of audio...")
-
-        # Set device if specified
-        if device_id is not None:
-            recording = sd.rec(int(duration * sample_rate), samplerate=sample_rate,
-                             channels=1, dtype='float32', device=device_id)
-        else:
-            recording = sd.rec(int(duration * sample_rate), samplerate=sample_rate,
-                             channels=1, dtype='float32')
-        sd.wait()
-        logger.info("Recording complete!")
-
-        # Save to file
-        write_wav(temp_path, sample_rate, (recording * 32767).astype(np.int16))
-        logger.info(f"Saved to {temp_path}")
-
-        logger.info("Transcribing with Whisper...")
-        model_name = os.getenv('WHISPER_MODEL', 'base')
-        model = whisper.load_model(model_name)
-        # Auto-detect language (don't force French)
-        result = model.transcribe(temp_path, fp16=False)
-
-        text = result['text'].strip()
+        text, language = _record_transcript(duration, sample_rate, device_id)
         logger.info(f"Transcription: {text}")
 
         return jsonify({
             "status": "ok",
             "text": text,
-            "language": result.get('language', 'unknown')
+            "language": language or 'unknown'
         })
 
     except ImportError as e:
         logger.error(f"Import error in transcribe: {e}")
-        return jsonify({"error": "Whisper not installed. Run: pip install openai-whisper"}), 500
+        return jsonify({"error": "Whisper not installed. Run: pip install faster-whisper"}), 500
 
     except Exception as e:
         logger.error("Error in transcribe endpoint", exc_info=True)
         return jsonify({"error": "Transcription failed"}), 500
 
-    finally:
-        # ALWAYS cleanup temporary file
-        if temp_path and os.path.exists(temp_path):
-            try:
-                os.unlink(temp_path)
-                logger.info(f"Cleaned up {temp_path}")
-            except Exception as cleanup_error:
-                logger.error(f"Failed to cleanup {temp_path}: {cleanup_error}")
+# Load the Whisper model and JIT kernels while the server is already accepting
+# requests. Started at import so it also runs under gunicorn or any other WSGI
+# server; skipped in the Flask reloader's watcher process, which serves nothing.
+if not DEBUG or os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+    threading.Thread(target=_warm_up, name='warm-up', daemon=True).start()
 
 if __name__ == '__main__':
     print("🦊 VRChat OSC Bridge - Lexis Edition (Secured)")
@@ -526,6 +943,7 @@ if __name__ == '__main__':
     print(f"   Listening on: {os.getenv('BRIDGE_HOST', '0.0.0.0')}:{os.getenv('BRIDGE_PORT', 8765)}")
     print(f"   Environment: {FLASK_ENV}")
     print(f"   Debug mode: {DEBUG}")
+    print(f"   Server: {'Flask dev server' if DEBUG else f'waitress ({BRIDGE_THREADS} threads)'}")
     print(f"   Authentication: ENABLED (API Key required)")
     print(f"   Rate limiting: ENABLED")
     print()
@@ -534,7 +952,7 @@ if __name__ == '__main__':
     print("  ✅ Rate limiting to prevent abuse")
     print("  ✅ Input validation with Pydantic")
     print("  ✅ Audit logging for sensitive operations")
-    print("  ✅ Secure temporary file handling")
+    print("  ✅ No temporary files for transcription")
     print()
     print("Endpoints:")
     print("  GET  /health      - Health check")
@@ -551,8 +969,12 @@ if __name__ == '__main__':
     print()
     logger.info("Starting VRChat OSC Bridge")
 
-    app.run(
-        host=os.getenv('BRIDGE_HOST', '0.0.0.0'),
-        port=int(os.getenv('BRIDGE_PORT', 8765)),
-        debug=DEBUG
-    )
+    host = os.getenv('BRIDGE_HOST', '0.0.0.0')
+    port = int(os.getenv('BRIDGE_PORT', 8765))
+
+    if DEBUG:
+        app.run(host=host, port=port, debug=True)
+    else:
+        # Thread-pooled production server: slow endpoints don't block the rest
+        from waitress import serve
+        serve(app, host=host, port=port, threads=BRIDGE_THREADS)
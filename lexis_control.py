@@ -4,11 +4,11 @@ Lexis VRChat Control - Client side
 Runs on Lexis's server to send commands to the bridge.
 """
 
-import urllib.request
-import urllib.error
+import http.client
 import json
 import sys
 import os
+import threading
 
 # Bridge configuration - use environment variables or defaults
 BRIDGE_HOST = os.getenv('BRIDGE_HOST', 'localhost')
@@ -16,10 +16,32 @@ BRIDGE_PORT = int(os.getenv('BRIDGE_PORT', 8765))
 BRIDGE_URL = f"http://{BRIDGE_HOST}:{BRIDGE_PORT}"
 API_KEY = os.getenv('API_KEY', '')
 
+# One keep-alive connection reused across commands; http.client reopens it
+# transparently when the server closes it between requests
+_conn = http.client.HTTPConnection(BRIDGE_HOST, BRIDGE_PORT, timeout=5)
+_conn_lock = threading.Lock()
+
+def _request(method, endpoint, body=None, headers=None):
+    """Send a request over the shared connection, returning (status, reason, body)"""
+    with _conn_lock:
+        # An idle keep-alive socket may have been dropped by the server; retry once on a fresh one
+        retries = 1 if _conn.sock is not None else 0
+        while True:
+            try:
+                _conn.request(method, endpoint, body=body, headers=headers or {})
+                response = _conn.getresponse()
+                return response.status, response.reason, response.read()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                _conn.close()
+                if not retries:
+                    raise
+                retries -= 1
+            except Exception:
+                _conn.close()
+                raise
+
 def send_command(endpoint, data=None):
     """Send a command to the bridge"""
-    url = f"{BRIDGE_URL}{endpoint}"
-
     if data is None:
         data = {}
 
@@ -31,18 +53,13 @@ def send_command(endpoint, data=None):
     if API_KEY:
         headers['Authorization'] = f'Bearer {API_KEY}'
 
-    req = urllib.request.Request(
-        url,
-        data=json.dumps(data).encode('utf-8'),
-        headers=headers,
-        method='POST'
-    )
-
     try:
-        with urllib.request.urlopen(req, timeout=5) as response:
-            return json.loads(response.read().decode('utf-8'))
-    except urllib.error.URLError as e:
+        status, reason, body = _request('POST', endpoint, json.dumps(data).encode('utf-8'), headers)
+    except (OSError, http.client.HTTPException) as e:
         return {"error": str(e)}
+    if status >= 400:
+        return {"error": f"HTTP Error {status}: {reason}"}
+    return json.loads(body.decode('utf-8'))
 
 def health_check():
     """Check if bridge is running"""
@@ -50,9 +67,10 @@ def health_check():
         headers = {}
         if API_KEY:
             headers['Authorization'] = f'Bearer {API_KEY}'
-        req = urllib.request.Request(f"{BRIDGE_URL}/health", headers=headers)
-        with urllib.request.urlopen(req, timeout=5) as response:
-            return json.loads(response.read().decode('utf-8'))
+        status, reason, body = _request('GET', '/health', headers=headers)
+        if status >= 400:
+            raise http.client.HTTPException(reason)
+        return json.loads(body.decode('utf-8'))
     except:
         return {"error": "Bridge not reachable"}
 
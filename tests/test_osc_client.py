@@ -0,0 +1,55 @@
+"""Tests for the connected OSC UDP client"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+os.environ.setdefault('API_KEY', 'test-key')
+
+import bridge
+
+
+class FailingSocket:
+    """Socket stand-in whose send() raises like a connected UDP socket after an ICMP error"""
+
+    def __init__(self, error):
+        self.error = error
+        self.sent = []
+
+    def send(self, dgram):
+        self.sent.append(dgram)
+        raise self.error
+
+
+class ConnectedUDPClientTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = bridge.ConnectedUDPClient('127.0.0.1', 9)
+
+    def tearDown(self):
+        self.client._sock.close()
+
+    def test_port_unreachable_is_dropped(self):
+        # Linux reports ECONNREFUSED, Windows WSAECONNRESET
+        for error in (ConnectionRefusedError(), ConnectionResetError()):
+            sock = FailingSocket(error)
+            self.client._sock, original = sock, self.client._sock
+            try:
+                self.client.send_raw(bridge._JUMP_ON)
+                self.client.send_message('/chatbox/typing', True)
+            finally:
+                self.client._sock = original
+            self.assertEqual(len(sock.sent), 2)
+
+    def test_other_errors_propagate(self):
+        self.client._sock, original = FailingSocket(OSError('boom')), self.client._sock
+        try:
+            with self.assertRaises(OSError):
+                self.client.send_raw(bridge._JUMP_ON)
+        finally:
+            self.client._sock = original
+
+
+if __name__ == '__main__':
+    unittest.main()